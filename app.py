@@ -1,44 +1,58 @@
 import streamlit as st
 import os
 from pathlib import Path
-import cv2
-import numpy as np
-import fitz
-from typing import List
+from typing import List, Dict, Any
 import base64
-from docx2pdf import convert
 import tempfile
+import hashlib
+import json
+import threading
+from contextlib import contextmanager
 
-# === Import your OCR & TTS classes ===
-from src.ocr.mistral_ocr import ocr_mistral   
-from src.ocr.paddle_ocr import PaddleOCREngine
-from src.tts.gtts_engine import GTTSEngine
-from src.preprocessing.image_preprocessing import preprocess_pipeline
+# === OCR & TTS engines are created lazily through the registries ===
+# cv2, fitz, docx2pdf and the engine SDKs are imported on first use, not at startup.
+from src.ocr.registry import create_ocr_engine
+from src.tts.registry import create_tts_engine
+from src.tts.base_tts import join_pages
+from src.utils.config import load_config
+
+OCR_CONFIG_PATH = os.path.join("configs", "ocr", "mistral.yaml")
+TTS_CONFIG_PATH = os.path.join("configs", "tts", "gtts.yaml")
+
+# Max OCR/TTS jobs running at once across all sessions (override with OCR_TTS_MAX_JOBS)
+MAX_CONCURRENT_JOBS = int(os.environ.get("OCR_TTS_MAX_JOBS", max(1, (os.cpu_count() or 2) // 2)))
+
+# Longest audio whose decoded PCM a session keeps in memory for splicing edits (override with
+# OCR_TTS_MAX_SPLICE_MINUTES); longer audio is spliced from the exported MP3 instead
+MAX_SPLICE_SECONDS = float(os.environ.get("OCR_TTS_MAX_SPLICE_MINUTES", 30)) * 60
 
 
 # --- Document Loader ---
-def load_document(uploaded_file) -> List[str]:
+def load_document(file_bytes: bytes, file_suffix: str) -> List[str]:
     """
-    Load uploaded document (pdf, docx, image) from Streamlit 
+    Load uploaded document bytes (pdf, docx, image) from Streamlit
     and return list of base64-encoded images.
     """
-    file_suffix = Path(uploaded_file.name).suffix.lower()
-
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file_suffix) as tmp_file:
-        tmp_file.write(uploaded_file.read())
-        tmp_path = Path(tmp_file.name)
+    import cv2
+    import numpy as np
+    from src.preprocessing.image_preprocessing import preprocess_pipeline
 
     if file_suffix == ".pdf":
-        return load_pdf(tmp_path)
-    
+        return load_pdf(file_bytes)
+
     elif file_suffix == ".docx":
-        convert(tmp_path)  # Convert DOCX -> PDF
-        return load_pdf(tmp_path.with_suffix(".pdf"))
-    
+        from docx2pdf import convert
+        # docx2pdf only works on paths, keep the files in a dir that is removed afterwards
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            docx_path = Path(tmp_dir) / f"upload{file_suffix}"
+            docx_path.write_bytes(file_bytes)
+            convert(str(docx_path))  # Convert DOCX -> PDF
+            pdf_bytes = docx_path.with_suffix(".pdf").read_bytes()
+        return load_pdf(pdf_bytes)
+
     elif file_suffix in [".png", ".jpg", ".jpeg"]:
         # Read image
-        img = cv2.imdecode(np.frombuffer(tmp_path.read_bytes(), np.uint8), cv2.IMREAD_COLOR)
+        img = cv2.imdecode(np.frombuffer(file_bytes, np.uint8), cv2.IMREAD_COLOR)
         processed = preprocess_pipeline(img)
         _, buffer = cv2.imencode(".png", processed)
         base64_img = base64.b64encode(buffer).decode("utf-8")
@@ -46,10 +60,15 @@ def load_document(uploaded_file) -> List[str]:
 
     else:
         raise ValueError(f"Unsupported file format: {file_suffix}")
-    
-def load_pdf(pdf_path: Path) -> List[str]:
-    """Convert PDF to preprocessed base64-encoded images."""
-    doc = fitz.open(pdf_path)
+
+def load_pdf(pdf_bytes: bytes) -> List[str]:
+    """Convert in-memory PDF to preprocessed base64-encoded images."""
+    import cv2
+    import fitz
+    import numpy as np
+    from src.preprocessing.image_preprocessing import preprocess_pipeline
+
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
     base64_images = []
 
     for page_num in range(len(doc)):
@@ -73,6 +92,90 @@ def load_pdf(pdf_path: Path) -> List[str]:
     return base64_images
 
 
+# --- Shared engines (one instance per server process, shared by all sessions) ---
+@st.cache_resource
+def get_ocr_engine():
+    return create_ocr_engine(load_config(OCR_CONFIG_PATH))
+
+
+@st.cache_resource
+def get_tts_engine(language: str, slow: bool):
+    config = load_config(TTS_CONFIG_PATH)
+    config.update({"language": language, "slow": slow})
+    return create_tts_engine(config)
+
+
+# --- Admission control ---
+@st.cache_resource
+def get_job_slots() -> threading.BoundedSemaphore:
+    """Process-wide limit on OCR/TTS jobs running at the same time."""
+    return threading.BoundedSemaphore(MAX_CONCURRENT_JOBS)
+
+
+@contextmanager
+def job_slot():
+    """Block until a job slot is free. Only taken on cache misses."""
+    slots = get_job_slots()
+    slots.acquire()
+    try:
+        yield
+    finally:
+        slots.release()
+
+
+# --- Memoized jobs ---
+@st.cache_data(show_spinner=False, max_entries=32)
+def run_ocr(file_hash: str, file_suffix: str, _file_bytes: bytes) -> str:
+    """OCR an upload; cached by content hash so widget changes don't re-OCR."""
+    ocr_engine = get_ocr_engine()
+
+    # One entry per page, empty pages included so "Jump to" page numbers match the document
+    all_text = []
+    with job_slot():
+        images = load_document(_file_bytes, file_suffix)
+        for img_b64 in images:
+            text_results = ocr_engine.extract_text(img_b64)  # <-- pass base64 string
+            all_text.append(" ".join([tr.text for tr in text_results]) if text_results else "")
+
+    return join_pages(all_text)
+
+
+# --- Per-session TTS state ---
+def get_session_audio_dir() -> str:
+    """Per-session directory for audio outputs, removed together with the session state."""
+    if "audio_dir" not in st.session_state:
+        st.session_state.audio_dir = tempfile.TemporaryDirectory()
+    return st.session_state.audio_dir.name
+
+
+def run_tts(text: str, language: str, slow: bool) -> Dict[str, Any]:
+    """
+    Synthesize text for this session and return its audio path and sync index.
+    After an edit only the changed lines are re-synthesized, the rest is spliced from the previous audio.
+    Only the state of the current (language, slow) setting is kept.
+    """
+    key = (language, slow)
+    state = st.session_state.get("tts_state")
+    if state and state["key"] != key:
+        # Audio made with other settings can't be spliced, free it
+        for path in (state["result"].audio_path, str(Path(state["result"].audio_path).with_suffix(".json"))):
+            if os.path.exists(path):
+                os.remove(path)
+        state = None
+    if state and state["text"] == text:
+        return state
+
+    tts_engine = get_tts_engine(language, slow)
+    output_path = os.path.join(get_session_audio_dir(), f"audio_{language}_{'slow' if slow else 'normal'}.mp3")
+    with job_slot():
+        result = tts_engine.synthesize(text, output_path, previous=state["result"] if state else None)
+    sync_index = tts_engine.write_sync_index(result, str(Path(output_path).with_suffix(".json")))
+    if result.duration > MAX_SPLICE_SECONDS:
+        result.audio = None
+
+    st.session_state.tts_state = {"key": key, "text": text, "result": result, "sync_index": sync_index}
+    return st.session_state.tts_state
+
 
 # --- App Config ---
 st.set_page_config(page_title="OCR + TTS App", page_icon="🎤", layout="centered")
@@ -92,27 +195,35 @@ uploaded_file = st.file_uploader("Upload a file", type=["pdf", "docx", "png", "j
 if uploaded_file:
     # === Run OCR ===
     st.subheader("📖 Extracted Text")
-    ocr_engine = ocr_mistral({"api_key": "T0lbb5RDSkMCbHsrPRyCjsJ7czOYCxMs"})  # replace with your config
-    images = load_document(uploaded_file)
-
-    all_text = []
-    for img_b64 in images:
-        text_results = ocr_engine.extract_text(img_b64)  # <-- pass base64 string
-
-        if text_results:
-            page_text = " ".join([tr.text for tr in text_results])
-            all_text.append(page_text)
+    file_bytes = uploaded_file.getvalue()
+    file_hash = hashlib.sha256(file_bytes).hexdigest()
+    file_suffix = Path(uploaded_file.name).suffix.lower()
 
-    extracted_text = "\n".join(all_text)
-    st.text_area("OCR Output", extracted_text, height=200)
+    with st.spinner("Running OCR..."):
+        extracted_text = run_ocr(file_hash, file_suffix, file_bytes)
+    # Users can correct OCR mistakes here, TTS reads the edited text
+    edited_text = st.text_area("OCR Output", extracted_text, height=200, key=f"ocr_text_{file_hash}")
 
     # === Run TTS ===
-    if extracted_text.strip():
+    if edited_text.strip():
         st.subheader("🎤 Text-to-Speech")
-        tts_engine = GTTSEngine({"language": language, "slow": slow})
-        output_path = "output_audio.mp3"
-        tts_result = tts_engine.synthesize(extracted_text, output_path)
+        with st.spinner("Generating speech..."):
+            tts_output = run_tts(edited_text, language, slow)
+        sync_index = tts_output["sync_index"]
+
+        # Seek to a page or heading using the sync index
+        marks = [(f"Page {p['page']}", p["start"]) for p in sync_index["pages"]]
+        marks += [(f"Page {h['page']}: {h['text']}", h["start"]) for h in sync_index["headings"]]
+        marks.sort(key=lambda mark: mark[1])
+        choice = st.selectbox("Jump to", range(len(marks)), format_func=lambda i: marks[i][0])
+        start_time = marks[choice][1]
 
         # Play audio
-        audio_bytes = open(output_path, "rb").read()
-        st.audio(audio_bytes, format="audio/mp3")
+        # Served from the session's file, so the MP3 bytes aren't also kept in session state
+        st.audio(tts_output["result"].audio_path, format="audio/mp3", start_time=int(start_time))
+        st.download_button(
+            "Download sync index",
+            json.dumps(sync_index, ensure_ascii=False, indent=2),
+            file_name="sync_index.json",
+            mime="application/json",
+        )
@@ -0,0 +1,186 @@
+import logging
+import time
+import base64
+from typing import Dict, Any, List
+
+import yaml
+
+from .base_ocr import BaseOCREngine, TextResult
+from .registry import create_ocr_engine
+
+
+class CascadeOCREngine(BaseOCREngine):
+    """
+    Runs a cheap OCR engine first and forwards only low-confidence work to slower engines.
+
+    `stages` lists engine configs (YAML paths or inline dicts), fastest first, e.g.
+    tesseract -> paddle -> mistral. In "page" mode a page whose mean confidence is
+    below `confidence_threshold` is re-OCRed by the next stage; in "line" mode only
+    the crops of low-confidence lines are. The last stage's output is always accepted.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.logger = logging.getLogger(__name__)
+        self.threshold = self.config.get("confidence_threshold", 0.6)
+        self.mode = self.config.get("mode", "page")
+        if self.mode not in ("page", "line"):
+            raise ValueError(f"Unknown cascade mode '{self.mode}', expected 'page' or 'line'")
+
+        self.stage_configs = [self._load_stage_config(stage) for stage in self.config.get("stages", [])]
+        if not self.stage_configs:
+            raise ValueError("Cascade OCR needs at least one stage")
+        self.stage_names = [cfg["engine"] for cfg in self.stage_configs]
+        # Stage engines are created on first use, so e.g. Mistral is never set up for clean documents
+        self._engines = [None] * len(self.stage_configs)
+        self.reset_stats()
+        self.logger.info(f"Cascade OCR engine initialized: {' -> '.join(self.stage_names)} ({self.mode} mode)")
+
+    @staticmethod
+    def _load_stage_config(stage) -> Dict[str, Any]:
+        if isinstance(stage, dict):
+            return stage
+        with open(stage, 'r') as file:
+            return yaml.safe_load(file)
+
+    def _get_engine(self, index: int):
+        if self._engines[index] is None:
+            config = self.stage_configs[index]
+            if index < len(self.stage_configs) - 1:
+                # Earlier stages must return low-confidence lines too, the cascade gates on them
+                config = dict(config, filter_confidence=False)
+            self._engines[index] = create_ocr_engine(config)
+        return self._engines[index]
+
+    def reset_stats(self):
+        """Clear the per-engine counters, call once per document."""
+        self.stats = {
+            "pages_by_engine": {name: 0 for name in self.stage_names},
+            "lines_by_engine": {name: 0 for name in self.stage_names},
+            "time_by_engine": {name: 0.0 for name in self.stage_names},
+            # Per-page timings, used to estimate what running every page through the second stage would cost
+            "_page_times": {name: [] for name in self.stage_names},
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-engine page/line counts, time spent, and the estimated time saved by the cascade."""
+        stats = {key: value for key, value in self.stats.items() if not key.startswith("_")}
+        stats["time_by_engine"] = {name: round(t, 3) for name, t in stats["time_by_engine"].items()}
+        stats["estimated_time_saved"], stats["time_saved_basis"] = self._estimate_time_saved()
+        return stats
+
+    def _estimate_time_saved(self):
+        """
+        Estimated seconds saved against OCRing every page with the second stage (the engine
+        the pipeline used before the cascade), and how that baseline was obtained.
+        The per-page cost of the second stage is measured from whole pages it OCRed, or taken
+        from `reference_page_time` when none were (all pages clean, or "line" mode).
+        """
+        if len(self.stage_names) < 2:
+            return None, "unknown: the cascade has a single stage"
+        reference = self.stage_names[1]
+        page_times = self.stats["_page_times"][reference]
+        if page_times:
+            page_time = sum(page_times) / len(page_times)
+            basis = f"measured: mean of {len(page_times)} whole pages on {reference}"
+        elif self.config.get("reference_page_time") is not None:
+            page_time = float(self.config["reference_page_time"])
+            basis = f"configured: reference_page_time for {reference}"
+        else:
+            return None, f"unknown: no whole page was OCRed by {reference} and reference_page_time is not set"
+
+        total_pages = sum(self.stats["pages_by_engine"].values())
+        actual = sum(self.stats["time_by_engine"].values())
+        return round(total_pages * page_time - actual, 3), basis
+
+    def _run_stage(self, index: int, image_b64: str, whole_page: bool = True) -> List[TextResult]:
+        engine = self._get_engine(index)
+        name = self.stage_names[index]
+        start = time.time()
+        if isinstance(engine, BaseOCREngine):
+            results = engine.extract_text_with_confidence(image_b64)
+        else:
+            # ocr_mistral only offers extract_text, returning TextResults without confidence
+            results = engine.extract_text(image_b64)
+        elapsed = time.time() - start
+        self.stats["time_by_engine"][name] += elapsed
+        if whole_page:
+            self.stats["_page_times"][name].append(elapsed)
+        return results
+
+    @staticmethod
+    def _confidence(results: List[TextResult]) -> float:
+        return sum([tr.confidence for tr in results]) / len(results) if results else 0.0
+
+    def extract_text(self, image_path: str) -> str:
+        return ' '.join([tr.text for tr in self.extract_text_with_confidence(image_path)])
+
+    def extract_text_with_confidence(self, image_path: str) -> List[TextResult]:
+        try:
+            if self.mode == "line":
+                return self._extract_by_line(image_path)
+            return self._extract_by_page(image_path)
+        except Exception as e:
+            self.logger.error(f"Cascade OCR extraction failed: {e}")
+            raise
+
+    def _extract_by_page(self, image_path: str) -> List[TextResult]:
+        last = len(self.stage_names) - 1
+        for index, name in enumerate(self.stage_names):
+            results = self._run_stage(index, image_path)
+            confidence = self._confidence(results)
+            if index == last or confidence >= self.threshold:
+                if index != last:
+                    # Earlier stages return unfiltered lines, drop the low-confidence ones like a standalone engine would
+                    results = [tr for tr in results if tr.confidence >= self.threshold]
+                self.stats["pages_by_engine"][name] += 1
+                self.stats["lines_by_engine"][name] += len(results)
+                return results
+            self.logger.info(f"{name} page confidence {confidence:.3f} < {self.threshold}, forwarding to {self.stage_names[index + 1]}")
+
+    def _decode_page(self, image_path: str):
+        import cv2
+        import numpy as np
+        return cv2.imdecode(np.frombuffer(base64.b64decode(image_path), np.uint8), cv2.IMREAD_COLOR)
+
+    def _crop_line(self, img, bbox) -> str:
+        """Crop a line box (plus `line_padding`) out of the page and return it base64-encoded."""
+        import cv2
+        padding = self.config.get("line_padding", 4)
+        x1, y1, x2, y2 = [int(v) for v in bbox]
+        h, w = img.shape[:2]
+        crop = img[max(0, y1 - padding):min(h, y2 + padding), max(0, x1 - padding):min(w, x2 + padding)]
+        _, buffer = cv2.imencode(".png", crop)
+        return base64.b64encode(buffer).decode("utf-8")
+
+    def _extract_by_line(self, image_path: str) -> List[TextResult]:
+        page_results = self._run_stage(0, image_path)
+        self.stats["pages_by_engine"][self.stage_names[0]] += 1
+        if len(self.stage_names) == 1:
+            self.stats["lines_by_engine"][self.stage_names[0]] += len(page_results)
+            return page_results
+
+        img = None
+        final_results = []
+        for line in page_results:
+            if line.confidence >= self.threshold or line.bbox is None:
+                self.stats["lines_by_engine"][self.stage_names[0]] += 1
+                final_results.append(line)
+                continue
+
+            if img is None:
+                img = self._decode_page(image_path)
+            crop_b64 = self._crop_line(img, line.bbox)
+
+            # Walk the remaining stages on the line crop until one is confident enough
+            last = len(self.stage_names) - 1
+            for index in range(1, len(self.stage_names)):
+                results = self._run_stage(index, crop_b64, whole_page=False)
+                if index == last or self._confidence(results) >= self.threshold:
+                    break
+            self.stats["lines_by_engine"][self.stage_names[index]] += 1
+            for tr in results:
+                # Crop-relative boxes are replaced by the line box on the page
+                tr.bbox = line.bbox
+            final_results.extend(results)
+        return final_results
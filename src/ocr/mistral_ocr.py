@@ -1,7 +1,6 @@
 from mistralai import Mistral
 from mistralai.models import ImageURLChunk  # important import
 from .base_ocr import TextResult
-import cv2, base64
 from typing import List
 
 class ocr_mistral:
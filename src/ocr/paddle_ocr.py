@@ -46,11 +46,13 @@ class PaddleOCREngine(BaseOCREngine):
             results = self.ocr.predict(img)
 
             text_results = []
+            # The cascade sets filter_confidence: false to see low-confidence lines too
+            filter_confidence = self.config.get("filter_confidence", True)
 
             for res in results:
                 # PaddleOCR classic mode (list of [coords, (text, conf)])
                 for text, conf, bbox in zip(res["rec_texts"], res["rec_scores"], res["rec_boxes"]):
-                    if conf > self.config.get("confidence_threshold", 0.7):
+                    if not filter_confidence or conf > self.config.get("confidence_threshold", 0.7):
                         text_results.append(TextResult(
                             text=text[::-1] if self.config['language'] == "ar" else text,
 
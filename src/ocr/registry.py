@@ -0,0 +1,32 @@
+import importlib
+from typing import Dict, Any, Tuple
+
+# engine name (the `engine:` field in configs/ocr/*.yaml) -> (module, class)
+# Modules are only imported when their engine is requested, so selecting one
+# backend never pays for importing the SDKs of the others.
+OCR_ENGINES: Dict[str, Tuple[str, str]] = {
+    "paddle": (".paddle_ocr", "PaddleOCREngine"),
+    "mistral": (".mistral_ocr", "ocr_mistral"),
+    "tesseract": (".tesseract_ocr", "TesseractOCREngine"),
+    "cascade": (".cascade_ocr", "CascadeOCREngine"),
+}
+
+
+def available_ocr_engines():
+    """Names of the OCR engines that can be created."""
+    return sorted(OCR_ENGINES)
+
+
+def get_ocr_engine_class(name: str):
+    """Import and return the OCR engine class registered under `name`."""
+    if name not in OCR_ENGINES:
+        raise ValueError(f"Unknown OCR engine '{name}', available: {available_ocr_engines()}")
+    module_name, class_name = OCR_ENGINES[name]
+    module = importlib.import_module(module_name, package=__package__)
+    return getattr(module, class_name)
+
+
+def create_ocr_engine(config: Dict[str, Any], name: str = None):
+    """Create the OCR engine selected by `name` or by the config's `engine` field."""
+    name = name or config.get("engine")
+    return get_ocr_engine_class(name)(config)
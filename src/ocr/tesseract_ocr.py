@@ -0,0 +1,106 @@
+import logging
+from typing import Dict, Any, List
+from .base_ocr import BaseOCREngine, TextResult
+import cv2
+import numpy as np
+import base64
+
+
+class TesseractOCREngine(BaseOCREngine):
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.logger = logging.getLogger(__name__)
+        self._initialize_engine()
+
+    def _initialize_engine(self):
+        try:
+            import pytesseract
+            self.pytesseract = pytesseract
+            self.language = self.config.get("language", "ara+eng")
+
+            # Fall back when the traineddata for the requested languages is missing
+            installed = set(pytesseract.get_languages(config=""))
+            if not set(self.language.split("+")) <= installed:
+                fallback = self.config.get("fallback_language", "eng")
+                self.logger.warning(f"Tesseract languages '{self.language}' not installed, using '{fallback}'")
+                self.language = fallback
+
+            self.tess_config = self.config.get(
+                "config", f"--oem {self.config.get('oem', 3)} --psm {self.config.get('psm', 6)}"
+            )
+            self.logger.info("Tesseract engine initialized successfully")
+        except ImportError as e:
+            self.logger.error(f"Failed to initialize Tesseract engine: {e}")
+            raise
+
+    def _decode_image(self, image_path: str):
+        # Decode Base64 string -> bytes -> OpenCV image
+        img_bytes = base64.b64decode(image_path)
+        nparr = np.frombuffer(img_bytes, np.uint8)
+        return cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+
+    def extract_text(self, image_path: str) -> str:
+        try:
+            results = self.extract_text_with_confidence(image_path)
+            text = ' '.join([tr.text for tr in results])
+            self.logger.info(f"Extracted {len(text)} characters")
+            return text
+        except Exception as e:
+            self.logger.error(f"OCR extraction failed: {e}")
+            raise
+
+    def extract_text_with_confidence(self, image_path: str) -> List[TextResult]:
+        """
+        Extract text lines with their confidence (0-1).
+        Lines below `confidence_threshold` are dropped like in PaddleOCREngine, unless the config
+        sets `filter_confidence: false` (the cascade does, to decide what to re-OCR).
+        """
+        try:
+            img = self._decode_image(image_path)
+            data = self.pytesseract.image_to_data(
+                img,
+                lang=self.language,
+                config=self.tess_config,
+                output_type=self.pytesseract.Output.DICT,
+            )
+
+            # Group words into lines, tesseract gives word-level boxes and confidences (0-100)
+            lines = {}
+            for i, word in enumerate(data["text"]):
+                conf = float(data["conf"][i])
+                if conf < 0 or not word.strip():
+                    continue
+                key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+                x, y, w, h = data["left"][i], data["top"][i], data["width"][i], data["height"][i]
+                line = lines.setdefault(key, {"words": [], "confs": [], "bbox": [x, y, x + w, y + h]})
+                line["words"].append(word)
+                line["confs"].append(conf)
+                bbox = line["bbox"]
+                line["bbox"] = [min(bbox[0], x), min(bbox[1], y), max(bbox[2], x + w), max(bbox[3], y + h)]
+
+            language = "ar" if self.language.startswith("ara") else "en"
+            threshold = self.config.get("confidence_threshold", 0.6)
+            filter_confidence = self.config.get("filter_confidence", True)
+            text_results = []
+            for line in lines.values():
+                conf = sum(line["confs"]) / len(line["confs"]) / 100.0
+                if filter_confidence and conf <= threshold:
+                    continue
+                text_results.append(TextResult(
+                    text=' '.join(line["words"]),
+                    confidence=conf,
+                    bbox=line["bbox"],
+                    language=language,
+                ))
+            return text_results
+        except Exception as e:
+            self.logger.error(f"OCR extraction with confidence failed: {e}")
+            raise
+
+    def is_available(self) -> bool:
+        try:
+            self.pytesseract.get_tesseract_version()
+            return True
+        except Exception as e:
+            self.logger.error(f"Tesseract binary not available: {e}")
+            return False
@@ -14,10 +14,11 @@ from dataclasses import dataclass
 
 # Use absolute imports instead of relative imports
 from preprocessing.document_loader import DocumentLoader
-from ocr.paddle_ocr import PaddleOCREngine
-from ocr.mistral_ocr import ocr_mistral
-
-from tts.gtts_engine import GTTSEngine
+# Engines are imported lazily through the registries, only the selected backends get loaded
+from ocr.registry import create_ocr_engine
+from ocr.base_ocr import BaseOCREngine
+from tts.registry import create_tts_engine
+from tts.base_tts import join_pages
 import shutil
 
 @dataclass
@@ -46,21 +47,15 @@ class AccessibilityPipeline:
             # Initialize document loader
             self.doc_loader = DocumentLoader()
             self.logger.info("✅ Document loader initialized successfully")
-            if self.config.get('ocr') == "paddle":
-
-                # Initialize OCR engine using your PaddleOCR class
-                self.ocr_engine = PaddleOCREngine(config.get('paddle_ocr', {}))
-                self.logger.info("✅ PaddleOCR engine initialized successfully")
-            
-            elif config.get('ocr') == "mistral":
+            # Initialize OCR engine selected by config['ocr'] (e.g. "paddle", "mistral")
+            ocr_name = self.config.get('ocr')
+            self.ocr_engine = create_ocr_engine(config.get(f'{ocr_name}_ocr', {}), ocr_name)
+            self.logger.info(f"✅ {ocr_name} OCR engine initialized successfully")
 
-                # Initialize OCR engine using your mistral_ocr class
-                self.ocr_engine = ocr_mistral(config.get('mistral_ocr', {}))
-                self.logger.info("✅ mistral_ocr engine initialized successfully")
-            
-            # Initialize TTS engine using your gTTS class
-            self.tts_engine = GTTSEngine(config.get('gtts_tts', {}))
-            self.logger.info("✅ gTTS engine initialized successfully")
+            # Initialize TTS engine selected by config['tts'] (defaults to gTTS)
+            self.tts_name = self.config.get('tts', "gtts")
+            self.tts_engine = create_tts_engine(config.get(f'{self.tts_name}_tts', {}), self.tts_name)
+            self.logger.info(f"✅ {self.tts_name} TTS engine initialized successfully")
             
         except Exception as e:
             self.logger.error(f"❌ Failed to initialize pipeline: {e}")
@@ -85,24 +80,28 @@ class AccessibilityPipeline:
 
             self.logger.info(f"✅ Loaded {len(image_paths)} pages/images")
             
-            # 2. Extract text from all pages using your PaddleOCR class
-            self.logger.info("🔍 Step 2: Extracting text with PaddleOCR...")
-            all_text = []
+            # 2. Extract text from all pages using the selected OCR engine
+            self.logger.info(f"🔍 Step 2: Extracting text with {self.config.get('ocr')} OCR...")
+            if hasattr(self.ocr_engine, 'reset_stats'):
+                # Cascade engine keeps per-document engine counts
+                self.ocr_engine.reset_stats()
+            # One entry per source page, pages without text stay empty so the sync index numbers pages right
+            all_text = [""] * len(image_paths)
             all_text_results = []
             successful_pages = 0
             
             for i, img_path in enumerate(image_paths):
                 try:
                     self.logger.info(f"Processing page/image {i+1}/{len(image_paths)}: {img_path}")
-                    if self.config.get('ocr') == "paddle":
+                    if isinstance(self.ocr_engine, BaseOCREngine):
 
-                        # Use your PaddleOCR class to extract text with confidence
+                        # Use the BaseOCREngine interface to extract text with confidence
                         text_results = self.ocr_engine.extract_text_with_confidence(img_path)
                         
                         if text_results:
                             # Combine all text from this page
                             page_text = ' '.join([tr.text for tr in text_results])
-                            all_text.append(page_text)
+                            all_text[i] = page_text
                             all_text_results.extend(text_results)
                             successful_pages += 1
                             
@@ -110,17 +109,17 @@ class AccessibilityPipeline:
                             self.logger.info(f"   📊 Confidence range: {min([tr.confidence for tr in text_results]):.3f} - {max([tr.confidence for tr in text_results]):.3f}")
                         else:
                             self.logger.warning(f"   ⚠️  Page {i+1}: No text extracted")
-                    elif self.config.get('ocr') == "mistral":
-                        # Use your mistral_ocr class to extract text
+                    else:
+                        # Use your mistral_ocr class to extract text (it only offers extract_text)
                         print("I am UP here")
                         text_results = self.ocr_engine.extract_text(img_path)
                         print("I am down here")
                         if text_results:
                             page_text = ' '.join([tr.text for tr in text_results])
-                            all_text.append(page_text)
+                            all_text[i] = page_text
                             all_text_results.extend(text_results)
                             successful_pages += 1
-                            self.logger.info(f"   ✅ Page {i+1}: Extracted {len(all_text)} characters")
+                            self.logger.info(f"   ✅ Page {i+1}: Extracted {len(page_text)} characters")
                         else:
                             self.logger.warning(f"   ⚠️  Page {i+1}: No text extracted")
 
@@ -130,7 +129,7 @@ class AccessibilityPipeline:
                     errors.append(error_msg)
             
             # Combine all extracted text
-            full_text = ' '.join(all_text)
+            full_text = ' '.join([text for text in all_text if text])
             
             if not full_text.strip():
                 raise ValueError("No text was extracted from the document")
@@ -152,8 +151,14 @@ class AccessibilityPipeline:
             output_audio = os.path.join(output_dir, f"{base_name}_audio.mp3")
             
             # Synthesize speech using your gTTS class
-            audio_result = self.tts_engine.synthesize(full_text, output_audio)
+            # TTS gets the pages separated by page breaks so the sync index can number them
+            tts_text = join_pages(all_text)
+            audio_result = self.tts_engine.synthesize(tts_text, output_audio)
             self.logger.info(f"✅ Speech synthesis completed: {output_audio}")
+
+            # Timing index so players can seek to a page or heading
+            sync_index = os.path.join(output_dir, f"{base_name}_sync.json")
+            self.tts_engine.write_sync_index(audio_result, sync_index)
             
             # 4. Save results as JSON
             self.logger.info("💾 Step 4: Saving results...")
@@ -162,6 +167,7 @@ class AccessibilityPipeline:
             results = {
                 "input_path": input_path,
                 "output_audio": output_audio,
+                "sync_index": sync_index,
                 "extracted_text": full_text,
                 "confidence": round(avg_confidence, 3),
                 "processing_time": round(time.time() - start_time, 2),
@@ -169,7 +175,7 @@ class AccessibilityPipeline:
                 "successful_pages": successful_pages,
                 "errors": errors,
                 "ocr_engine": self.config.get('ocr'),
-                "tts_engine": "gtts",
+                "tts_engine": self.tts_name,
                 "audio_metadata": {
                     "duration": audio_result.duration,
                     "sample_rate": audio_result.sample_rate,
@@ -186,6 +192,10 @@ class AccessibilityPipeline:
                 ]
             }
             
+            if hasattr(self.ocr_engine, 'get_stats'):
+                # Per-engine page counts and time saved by the OCR cascade
+                results["ocr_cascade"] = self.ocr_engine.get_stats()
+
             # Save JSON with proper encoding for Arabic text
             with open(json_output, 'w', encoding='utf-8') as f:
                 json.dump(results, f, ensure_ascii=False, indent=2)
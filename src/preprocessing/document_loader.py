@@ -2,7 +2,6 @@ import logging
 from typing import List
 from pathlib import Path
 import fitz  # PyMuPDF
-from docx2pdf import convert
 import base64
 import cv2
 
@@ -25,6 +24,7 @@ class DocumentLoader:
         if file_path.suffix == ".pdf":
             return self._load_pdf(file_path)
         elif file_path.suffix == ".docx":
+            from docx2pdf import convert  # only needed for DOCX input
             convert(file_path)
             return self._load_pdf(file_path)
         elif file_path.suffix.lower() in ['.png', '.jpg', '.jpeg']:
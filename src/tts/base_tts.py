@@ -1,6 +1,32 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field, asdict
+import difflib
+import json
+import re
+
+# Separator between pages in the text handed to TTS, used to number segments by page
+PAGE_BREAK = "\f"
+
+
+def join_pages(pages: List[str]) -> str:
+    """
+    Join per-page texts with PAGE_BREAK for synthesis.
+    Pass one entry per source page (empty string for pages without text) so page numbers stay right.
+    """
+    return f"\n{PAGE_BREAK}\n".join(pages)
+
+
+@dataclass
+class SpeechSegment:
+    text: str
+    kind: str  # "heading" or "text"
+    page: int
+    char_start: int  # span of the segment in the synthesized text
+    char_end: int
+    audio_start_ms: int = 0  # span of the segment in the output audio
+    audio_end_ms: int = 0
+
 
 @dataclass
 class AudioResult:
@@ -9,17 +35,90 @@ class AudioResult:
     sample_rate: int
     language: str
     text_length: int
+    segments: List[SpeechSegment] = field(default_factory=list)
+    # Engine settings the audio was made with, `previous` is only reused when they match
+    settings: Dict[str, Any] = field(default_factory=dict)
+    # Unencoded audio kept in memory (e.g. a pydub AudioSegment); unchanged segments are spliced
+    # from it so they are not decoded from and re-encoded to the lossy output file again.
+    # Callers may set it to None to save memory, engines then fall back to the file at audio_path.
+    audio: Any = field(default=None, repr=False, compare=False)
 
 
 class BaseTTSEngine(ABC):
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        
+
     @abstractmethod
-    def synthesize(self, text: str, language: str) -> AudioResult:
-        """Convert text to speech and save to file."""
+    def synthesize(self, text: str, output_path: str, previous: Optional[AudioResult] = None) -> AudioResult:
+        """
+        Convert text to speech and save to file.
+        If `previous` is given, segments whose text did not change are spliced from its audio.
+        Engines keep no per-call state, callers hold on to their own previous result.
+        """
         pass
-    
+
     def is_available(self) -> bool:
         """Check if the engine is available and ready to use."""
-        return True
\ No newline at end of file
+        return True
+
+    def segment_text(self, text: str) -> List[SpeechSegment]:
+        """Split text into one segment per non-empty line, markdown headings marked as such."""
+        segments = []
+        page = 1
+        offset = 0
+        for line in text.split("\n"):
+            page += line.count(PAGE_BREAK)
+            stripped = line.replace(PAGE_BREAK, " ").strip()
+            if stripped:
+                start = offset + line.index(stripped[0])
+                segments.append(SpeechSegment(
+                    text=stripped,
+                    kind="heading" if re.match(r"^#+", stripped) else "text",
+                    page=page,
+                    char_start=start,
+                    char_end=start + len(stripped),
+                ))
+            offset += len(line) + 1
+        return segments
+
+    @staticmethod
+    def match_segments(segments: List[SpeechSegment], previous: Optional[AudioResult]) -> List[Optional[SpeechSegment]]:
+        """
+        Diff new segments against the previous segmentation.
+        Returns, for each new segment, the previous segment with identical speech or None if it must be synthesized.
+        """
+        matches = [None] * len(segments)
+        if previous is None or not previous.segments:
+            return matches
+        old_keys = [(seg.kind, seg.text) for seg in previous.segments]
+        new_keys = [(seg.kind, seg.text) for seg in segments]
+        matcher = difflib.SequenceMatcher(a=old_keys, b=new_keys, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                for old_index, new_index in zip(range(i1, i2), range(j1, j2)):
+                    matches[new_index] = previous.segments[old_index]
+        return matches
+
+    def write_sync_index(self, result: AudioResult, index_path: str) -> Dict[str, Any]:
+        """Save the segment map as a JSON timing index so players can seek to a page or heading."""
+        index = {
+            "audio_path": result.audio_path,
+            "duration": result.duration,
+            "language": result.language,
+            "pages": [],
+            "headings": [],
+            "segments": [],
+        }
+        for i, seg in enumerate(result.segments):
+            start, end = seg.audio_start_ms / 1000.0, seg.audio_end_ms / 1000.0
+            if not index["pages"] or index["pages"][-1]["page"] != seg.page:
+                index["pages"].append({"page": seg.page, "start": start, "segment": i})
+            if seg.kind == "heading":
+                index["headings"].append({"text": seg.text.strip("# "), "page": seg.page, "start": start, "segment": i})
+            entry = asdict(seg)
+            entry.update({"start": start, "end": end})
+            index["segments"].append(entry)
+
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+        return index
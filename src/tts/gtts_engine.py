@@ -1,9 +1,8 @@
 import logging
-import re
 import io
-from gtts import gTTS
-from .base_tts import BaseTTSEngine, AudioResult
-from typing import Dict, Any
+import os
+from .base_tts import BaseTTSEngine, AudioResult, SpeechSegment
+from typing import Dict, Any, Optional
 from pydub import AudioSegment
 
 class GTTSEngine(BaseTTSEngine):
@@ -11,38 +10,64 @@ class GTTSEngine(BaseTTSEngine):
         super().__init__(config)
         self.logger = logging.getLogger(__name__)
 
-    def synthesize(self, text: str, output_path: str) -> AudioResult:
-        try:
-            audio_segments = []
-            lines = text.split("\n")
-            self.logger.info(f"Starting TTS synthesis for {len(text)} characters")
+    def _settings(self) -> Dict[str, Any]:
+        # Everything that changes how a segment sounds
+        return {"language": self.config.get("language", "ar"), "slow": self.config.get("slow", False)}
 
-            for line in lines:
-                if not line.strip():
-                    continue  # skip empty lines
+    def _synthesize_segment(self, segment: SpeechSegment) -> AudioSegment:
+        from gtts import gTTS  # network client, only needed when a segment is actually synthesized
 
-                # Detect heading (starts with one or more #)
-                if re.match(r"^#+", line.strip()):
-                    clean_text = line.strip("# ").upper()
-                    tts = gTTS(text=clean_text, lang=self.config.get("language", "ar"), slow=True)
-                else:
-                    tts = gTTS(text=line.strip(), lang=self.config.get("language", "ar"), slow=False)
+        # Headings are read slowly and uppercased
+        if segment.kind == "heading":
+            clean_text = segment.text.strip("# ").upper()
+            tts = gTTS(text=clean_text, lang=self.config.get("language", "ar"), slow=True)
+        else:
+            tts = gTTS(text=segment.text, lang=self.config.get("language", "ar"), slow=self.config.get("slow", False))
 
-                # Save gTTS output to memory (not file)
-                mp3_fp = io.BytesIO()
-                tts.write_to_fp(mp3_fp)
-                mp3_fp.seek(0)
+        # Save gTTS output to memory (not file)
+        mp3_fp = io.BytesIO()
+        tts.write_to_fp(mp3_fp)
+        mp3_fp.seek(0)
 
-                # Load directly into AudioSegment
-                audio_segments.append(AudioSegment.from_file(mp3_fp, format="mp3"))
+        # Load directly into AudioSegment
+        return AudioSegment.from_file(mp3_fp, format="mp3")
+
+    def synthesize(self, text: str, output_path: str, previous: Optional[AudioResult] = None) -> AudioResult:
+        try:
+            segments = self.segment_text(text)
+            self.logger.info(f"Starting TTS synthesis for {len(text)} characters")
 
-            if not audio_segments:
+            if not segments:
                 raise ValueError("No audio generated (empty text input?)")
 
-            # Combine all segments with pause
-            final_audio = audio_segments[0]
-            for seg in audio_segments[1:]:
-                final_audio += AudioSegment.silent(duration=600) + seg
+            # Unchanged segments are cut out of the previous in-memory audio instead of calling gTTS again
+            settings = self._settings()
+            if previous is not None and previous.settings != settings:
+                previous = None
+            matches = self.match_segments(segments, previous)
+            previous_audio = previous.audio if previous is not None else None
+            if previous_audio is None and any(matches):
+                if os.path.exists(previous.audio_path):
+                    # Callers may drop the in-memory audio to save memory, fall back to the exported file
+                    previous_audio = AudioSegment.from_file(previous.audio_path, format="mp3")
+                else:
+                    matches = [None] * len(segments)
+
+            # Combine all segments with pause, recording where each one lands
+            final_audio = AudioSegment.empty()
+            for i, (segment, match) in enumerate(zip(segments, matches)):
+                if match is not None:
+                    seg_audio = previous_audio[match.audio_start_ms:match.audio_end_ms]
+                else:
+                    seg_audio = self._synthesize_segment(segment)
+                if i > 0:
+                    final_audio += AudioSegment.silent(duration=600)
+                segment.audio_start_ms = len(final_audio)
+                final_audio += seg_audio
+                segment.audio_end_ms = len(final_audio)
+
+            reused = sum(1 for match in matches if match is not None)
+            self.logger.info(f"Synthesized {len(segments) - reused} segments, reused {reused} from previous audio")
 
             # Export final audio once
             final_audio.export(output_path, format="mp3")
@@ -58,6 +83,9 @@ class GTTSEngine(BaseTTSEngine):
                 sample_rate=sample_rate,
                 language=self.config.get("language", "ar"),
                 text_length=len(text),
+                segments=segments,
+                settings=settings,
+                audio=final_audio,
             )
 
         except Exception as e:
@@ -0,0 +1,29 @@
+import importlib
+from typing import Dict, Any, Tuple
+
+# engine name (the `engine:` field in configs/tts/*.yaml) -> (module, class)
+# Modules are only imported when their engine is requested, so selecting one
+# backend never pays for importing the SDKs of the others.
+TTS_ENGINES: Dict[str, Tuple[str, str]] = {
+    "gtts": (".gtts_engine", "GTTSEngine"),
+}
+
+
+def available_tts_engines():
+    """Names of the TTS engines that can be created."""
+    return sorted(TTS_ENGINES)
+
+
+def get_tts_engine_class(name: str):
+    """Import and return the TTS engine class registered under `name`."""
+    if name not in TTS_ENGINES:
+        raise ValueError(f"Unknown TTS engine '{name}', available: {available_tts_engines()}")
+    module_name, class_name = TTS_ENGINES[name]
+    module = importlib.import_module(module_name, package=__package__)
+    return getattr(module, class_name)
+
+
+def create_tts_engine(config: Dict[str, Any], name: str = None):
+    """Create the TTS engine selected by `name` or by the config's `engine` field."""
+    name = name or config.get("engine")
+    return get_tts_engine_class(name)(config)
@@ -0,0 +1,65 @@
+import sys
+import os
+import json
+import subprocess
+
+# Measures import/startup cost of the lazy engine registries against importing
+# every engine eagerly (what main_pipeline.py and app.py used to do).
+# Each measurement runs in a fresh interpreter so nothing is already cached.
+#
+#   python tests/startup_benchmark.py [ocr_engine] [tts_engine]
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+HEAVY_MODULES = ["paddleocr", "mistralai", "cv2", "fitz", "docx2pdf", "gtts", "pydub"]
+REPEATS = 3
+
+SNIPPET = """
+import sys, time, json
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+CASES = {
+    "eager engine imports": (
+        "from ocr.paddle_ocr import PaddleOCREngine\n"
+        "from ocr.mistral_ocr import ocr_mistral\n"
+        "from tts.gtts_engine import GTTSEngine\n"
+    ),
+    "lazy registry imports": (
+        "from ocr.registry import create_ocr_engine\n"
+        "from tts.registry import create_tts_engine\n"
+    ),
+    "lazy registry + selected engines": (
+        "from ocr.registry import get_ocr_engine_class\n"
+        "from tts.registry import get_tts_engine_class\n"
+        "get_ocr_engine_class({ocr!r})\n"
+        "get_tts_engine_class({tts!r})\n"
+    ),
+}
+
+
+def measure(body: str):
+    code = SNIPPET.format(src=SRC_DIR, body=body, heavy=HEAVY_MODULES)
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if proc.returncode != 0:
+        return None, proc.stderr.strip().splitlines()[-1]
+    return json.loads(proc.stdout.strip().splitlines()[-1]), None
+
+
+if __name__ == "__main__":
+    ocr_name = sys.argv[1] if len(sys.argv) > 1 else "mistral"
+    tts_name = sys.argv[2] if len(sys.argv) > 2 else "gtts"
+
+    for name, body in CASES.items():
+        body = body.format(ocr=ocr_name, tts=tts_name)
+        runs = [measure(body) for _ in range(REPEATS)]
+        failed = [err for res, err in runs if res is None]
+        if failed:
+            print(f"{name:<36} failed: {failed[0]}")
+            continue
+        best = min(res["seconds"] for res, _ in runs)
+        loaded = runs[0][0]["loaded"]
+        print(f"{name:<36} {best * 1000:9.1f} ms   heavy modules loaded: {', '.join(loaded) or '-'}")
@@ -0,0 +1,182 @@
+import sys
+import os
+import json
+
+import pytest
+
+# Add src to path so we can import from src modules
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tts.base_tts import BaseTTSEngine, AudioResult, PAGE_BREAK, join_pages
+
+
+class FakeTTSEngine(BaseTTSEngine):
+    def synthesize(self, text, output_path, previous=None):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def engine():
+    return FakeTTSEngine({})
+
+
+def with_offsets(segments, length_ms=1000, pause_ms=600):
+    """Give segments consecutive audio spans like GTTSEngine does."""
+    position = 0
+    for seg in segments:
+        seg.audio_start_ms = position
+        seg.audio_end_ms = position + length_ms
+        position += length_ms + pause_ms
+    return segments
+
+
+def result_for(engine, text):
+    segments = with_offsets(engine.segment_text(text))
+    return AudioResult("audio.mp3", segments[-1].audio_end_ms / 1000.0, 22050, "ar", len(text), segments)
+
+
+def test_segment_text_spans_and_headings(engine):
+    text = "# Title\n  first line  \n\nsecond line"
+    segments = engine.segment_text(text)
+
+    assert [(seg.kind, seg.text) for seg in segments] == [
+        ("heading", "# Title"), ("text", "first line"), ("text", "second line"),
+    ]
+    for seg in segments:
+        assert text[seg.char_start:seg.char_end] == seg.text
+
+
+def test_segment_text_numbers_pages_across_page_breaks(engine):
+    text = f"page one\n{PAGE_BREAK}\n## Heading\npage two\n{PAGE_BREAK}\n{PAGE_BREAK}\npage four"
+    segments = engine.segment_text(text)
+
+    assert [(seg.text, seg.page) for seg in segments] == [
+        ("page one", 1), ("## Heading", 2), ("page two", 2), ("page four", 4),
+    ]
+    heading = segments[1]
+    assert text[heading.char_start:heading.char_end] == "## Heading"
+
+
+def test_join_pages_keeps_numbering_with_empty_pages(engine):
+    segments = engine.segment_text(join_pages(["first", "", "third", "", ""]))
+    assert [(seg.text, seg.page) for seg in segments] == [("first", 1), ("third", 3)]
+
+    segments = engine.segment_text(join_pages(["", "second"]))
+    assert [(seg.text, seg.page) for seg in segments] == [("second", 2)]
+
+
+def test_match_segments_without_previous(engine):
+    segments = engine.segment_text("a\nb")
+    assert engine.match_segments(segments, None) == [None, None]
+
+
+def test_match_segments_reuses_only_unchanged_lines(engine):
+    previous = result_for(engine, "# Title\nline one\nline two\nline three")
+    segments = engine.segment_text("# Title\nline one fixed\nline two\nline three\nline four")
+    matches = engine.match_segments(segments, previous)
+
+    assert [m.text if m else None for m in matches] == ["# Title", None, "line two", "line three", None]
+    # Matched segments point at their own audio in the previous result
+    assert matches[2] is previous.segments[2]
+
+
+def test_match_segments_with_duplicate_lines(engine):
+    previous = result_for(engine, "same\nsame\nother\nsame")
+    segments = engine.segment_text("same\nedited\nother\nsame")
+    matches = engine.match_segments(segments, previous)
+
+    assert matches[1] is None
+    # Each reused duplicate maps to a distinct previous segment, in order
+    reused = [m for m in matches if m is not None]
+    assert len(reused) == 3
+    assert len({id(m) for m in reused}) == 3
+    assert [previous.segments.index(m) for m in reused] == sorted(previous.segments.index(m) for m in reused)
+
+
+def test_match_segments_heading_and_text_differ(engine):
+    previous = result_for(engine, "# Intro")
+    segments = engine.segment_text("Intro")
+    assert engine.match_segments(segments, previous) == [None]
+
+
+def test_write_sync_index(engine, tmp_path):
+    result = result_for(engine, f"# Title\nintro\n{PAGE_BREAK}\n## Part two\nbody")
+    index_path = tmp_path / "sync.json"
+    index = engine.write_sync_index(result, str(index_path))
+
+    assert json.loads(index_path.read_text(encoding="utf-8")) == index
+    assert index["pages"] == [
+        {"page": 1, "start": 0.0, "segment": 0},
+        {"page": 2, "start": 3.2, "segment": 2},
+    ]
+    assert index["headings"] == [
+        {"text": "Title", "page": 1, "start": 0.0, "segment": 0},
+        {"text": "Part two", "page": 2, "start": 3.2, "segment": 2},
+    ]
+    assert [(seg["start"], seg["end"]) for seg in index["segments"]] == [
+        (0.0, 1.0), (1.6, 2.6), (3.2, 4.2), (4.8, 5.8),
+    ]
+
+
+@pytest.fixture
+def fake_gtts(monkeypatch):
+    """GTTSEngine with gTTS calls and MP3 export replaced; returns the list of synthesized texts."""
+    pydub = pytest.importorskip("pydub")
+    from tts.gtts_engine import GTTSEngine
+
+    synthesized = []
+
+    def fake_segment(self, segment):
+        synthesized.append(segment.text)
+        return pydub.AudioSegment.silent(duration=100 * len(segment.text))
+
+    monkeypatch.setattr(GTTSEngine, "_synthesize_segment", fake_segment)
+    # Exporting needs ffmpeg, only the in-memory splice is under test
+    monkeypatch.setattr(pydub.AudioSegment, "export", lambda self, *args, **kwargs: None)
+    monkeypatch.setattr(pydub.AudioSegment, "from_file", None)
+    return GTTSEngine, synthesized
+
+
+def test_gtts_splices_unchanged_segments_from_memory(fake_gtts, tmp_path):
+    GTTSEngine, synthesized = fake_gtts
+    tts = GTTSEngine({"language": "en"})
+
+    first = tts.synthesize("one\ntwo\nthree", str(tmp_path / "a.mp3"))
+    synthesized.clear()
+    second = tts.synthesize("one\ntwo fixed\nthree", str(tmp_path / "a.mp3"), previous=first)
+
+    assert synthesized == ["two fixed"]
+    assert [(seg.audio_start_ms, seg.audio_end_ms) for seg in second.segments] == [
+        (0, 300), (900, 1800), (2400, 2900),
+    ]
+    assert len(second.audio) == 2900
+
+
+def test_gtts_does_not_splice_audio_made_with_other_settings(fake_gtts, tmp_path):
+    GTTSEngine, synthesized = fake_gtts
+    normal = GTTSEngine({"language": "en", "slow": False})
+    slow = GTTSEngine({"language": "en", "slow": True})
+
+    first = normal.synthesize("one\ntwo", str(tmp_path / "a.mp3"))
+    synthesized.clear()
+    slow.synthesize("one\ntwo", str(tmp_path / "b.mp3"), previous=first)
+
+    assert synthesized == ["one", "two"]
+
+
+def test_gtts_splices_from_file_when_memory_audio_dropped(fake_gtts, tmp_path, monkeypatch):
+    GTTSEngine, synthesized = fake_gtts
+    import pydub
+    tts = GTTSEngine({"language": "en"})
+    audio_path = tmp_path / "a.mp3"
+
+    first = tts.synthesize("one\ntwo", str(audio_path))
+    audio_path.write_bytes(b"")  # export is stubbed, the file only has to exist
+    decoded = first.audio
+    first.audio = None
+    monkeypatch.setattr(pydub.AudioSegment, "from_file", lambda path, format=None: decoded)
+    synthesized.clear()
+    second = tts.synthesize("one\ntwo\nthree", str(audio_path), previous=first)
+
+    assert synthesized == ["three"]
+    assert len(second.audio) == len(decoded) + 600 + 500
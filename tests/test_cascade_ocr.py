@@ -0,0 +1,137 @@
+import sys
+import os
+
+import pytest
+
+# Add src to path so we can import from src modules
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ocr import cascade_ocr
+from ocr.base_ocr import BaseOCREngine, TextResult
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+
+class FakeEngine(BaseOCREngine):
+    """Returns canned lines per image and advances the fake clock by a fixed cost per call."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.clock = config["clock"]
+        self.cost = config["cost"]
+        self.pages = config["pages"]
+        self.calls = []
+
+    def extract_text(self, image_path):
+        return ' '.join([tr.text for tr in self.extract_text_with_confidence(image_path)])
+
+    def extract_text_with_confidence(self, image_path):
+        self.calls.append(image_path)
+        self.clock.now += self.cost
+        return [TextResult(text=t, confidence=c, bbox=[0, 0, 10, 10]) for t, c in self.pages[image_path]]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cascade_ocr, "time", clock)
+    monkeypatch.setattr(cascade_ocr, "create_ocr_engine", FakeEngine)
+    return clock
+
+
+def make_cascade(clock, mode, fast_pages, slow_pages, **extra):
+    config = {
+        "engine": "cascade",
+        "confidence_threshold": 0.6,
+        "mode": mode,
+        "stages": [
+            {"engine": "fast", "clock": clock, "cost": 1.0, "pages": fast_pages},
+            {"engine": "slow", "clock": clock, "cost": 5.0, "pages": slow_pages},
+        ],
+    }
+    config.update(extra)
+    return cascade_ocr.CascadeOCREngine(config)
+
+
+def test_page_mode_forwards_only_low_confidence_pages(clock):
+    fast = {"p1": [("clean", 0.9)], "p2": [("blurry", 0.3)], "p3": [("clean", 0.8)]}
+    slow = {"p2": [("fixed", 0.95)]}
+    engine = make_cascade(clock, "page", fast, slow)
+
+    texts = [engine.extract_text(page) for page in ["p1", "p2", "p3"]]
+    stats = engine.get_stats()
+
+    assert texts == ["clean", "fixed", "clean"]
+    # Pages are counted under the engine whose output was kept
+    assert stats["pages_by_engine"] == {"fast": 2, "slow": 1}
+    assert stats["time_by_engine"] == {"fast": 3.0, "slow": 5.0}
+    # 3 pages x 5s on the slow engine vs 8s spent
+    assert stats["estimated_time_saved"] == 7.0
+    assert stats["time_saved_basis"].startswith("measured")
+
+
+def test_page_mode_drops_low_confidence_lines_of_accepted_page(clock):
+    fast = {"p1": [("good", 0.95), ("garbage", 0.1), ("fine", 0.9)]}
+    engine = make_cascade(clock, "page", fast, {})
+
+    results = engine.extract_text_with_confidence("p1")
+    stats = engine.get_stats()
+
+    assert [tr.text for tr in results] == ["good", "fine"]
+    assert stats["pages_by_engine"] == {"fast": 1, "slow": 0}
+    assert stats["lines_by_engine"] == {"fast": 2, "slow": 0}
+
+
+def test_page_mode_all_clean_uses_reference_page_time(clock):
+    fast = {"p1": [("clean", 0.9)], "p2": [("clean", 0.7)]}
+    engine = make_cascade(clock, "page", fast, {}, reference_page_time=4.0)
+
+    for page in fast:
+        engine.extract_text_with_confidence(page)
+    stats = engine.get_stats()
+
+    assert stats["pages_by_engine"] == {"fast": 2, "slow": 0}
+    assert stats["estimated_time_saved"] == 6.0
+    assert stats["time_saved_basis"].startswith("configured")
+
+
+def test_time_saved_unknown_without_reference(clock):
+    engine = make_cascade(clock, "page", {"p1": [("clean", 0.9)]}, {})
+    engine.extract_text_with_confidence("p1")
+    stats = engine.get_stats()
+
+    assert stats["estimated_time_saved"] is None
+    assert stats["time_saved_basis"].startswith("unknown")
+
+
+def test_line_mode_forwards_only_low_confidence_lines(clock, monkeypatch):
+    monkeypatch.setattr(cascade_ocr.CascadeOCREngine, "_decode_page", lambda self, image_path: image_path)
+    monkeypatch.setattr(cascade_ocr.CascadeOCREngine, "_crop_line", lambda self, img, bbox: "crop")
+    fast = {"p1": [("good", 0.9), ("bad", 0.2), ("good too", 0.8)]}
+    slow = {"crop": [("fixed", 0.95)]}
+    engine = make_cascade(clock, "line", fast, slow, reference_page_time=10.0)
+
+    results = engine.extract_text_with_confidence("p1")
+    stats = engine.get_stats()
+
+    assert [tr.text for tr in results] == ["good", "fixed", "good too"]
+    assert stats["pages_by_engine"] == {"fast": 1, "slow": 0}
+    assert stats["lines_by_engine"] == {"fast": 2, "slow": 1}
+    assert stats["time_by_engine"] == {"fast": 1.0, "slow": 5.0}
+    # Line crops are not whole pages, so the configured reference is the baseline
+    assert stats["estimated_time_saved"] == 4.0
+    assert stats["time_saved_basis"].startswith("configured")
+
+
+def test_reset_stats_clears_counts(clock):
+    engine = make_cascade(clock, "page", {"p1": [("clean", 0.9)]}, {})
+    engine.extract_text_with_confidence("p1")
+    engine.reset_stats()
+
+    assert engine.get_stats()["pages_by_engine"] == {"fast": 0, "slow": 0}
@@ -0,0 +1,69 @@
+import sys
+import os
+import subprocess
+
+import pytest
+
+# Add src to path so we can import from src modules
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.append(SRC_DIR)
+
+from ocr import registry as ocr_registry
+from tts import registry as tts_registry
+
+
+def test_unknown_ocr_engine_lists_available():
+    with pytest.raises(ValueError) as excinfo:
+        ocr_registry.get_ocr_engine_class("coqui")
+    for name in ocr_registry.available_ocr_engines():
+        assert name in str(excinfo.value)
+
+
+def test_unknown_tts_engine_lists_available():
+    with pytest.raises(ValueError) as excinfo:
+        tts_registry.create_tts_engine({"engine": "openai"})
+    assert "gtts" in str(excinfo.value)
+
+
+def test_create_ocr_engine_uses_config_engine():
+    engine = ocr_registry.create_ocr_engine({"engine": "cascade", "stages": [{"engine": "paddle"}]})
+    assert type(engine).__name__ == "CascadeOCREngine"
+
+
+def test_create_ocr_engine_name_overrides_config():
+    with pytest.raises(ValueError):
+        ocr_registry.create_ocr_engine({"engine": "cascade", "stages": [{"engine": "paddle"}]}, "nope")
+
+
+def test_create_tts_engine_uses_config_engine():
+    pytest.importorskip("pydub")
+    engine = tts_registry.create_tts_engine({"engine": "gtts", "language": "en"})
+    assert type(engine).__name__ == "GTTSEngine"
+
+
+def run_isolated(code):
+    """Run code in a fresh interpreter and return the heavy modules it imported."""
+    heavy = ["paddleocr", "mistralai", "pytesseract", "cv2", "gtts"]
+    script = (
+        f"import sys\nsys.path.insert(0, {SRC_DIR!r})\n{code}\n"
+        f"print(','.join(m for m in {heavy!r} if m in sys.modules))"
+    )
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return proc.stdout.strip().splitlines()[-1] if proc.stdout.strip() else ""
+
+
+def test_cascade_loads_without_stage_backends():
+    loaded = run_isolated(
+        "from ocr.registry import get_ocr_engine_class, create_ocr_engine\n"
+        "get_ocr_engine_class('cascade')\n"
+        "create_ocr_engine({'engine': 'cascade', 'stages': [{'engine': 'tesseract'}, {'engine': 'paddle'}, {'engine': 'mistral'}]})"
+    )
+    assert loaded == ""
+
+
+def test_registry_imports_no_backends():
+    loaded = run_isolated(
+        "import ocr.registry\n"
+        "import tts.registry"
+    )
+    assert loaded == ""